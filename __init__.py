@@ -1,8 +1,9 @@
 """Custom Integration to setup Minimalist UI"""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from homeassistant.components import frontend
 from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
@@ -10,11 +11,24 @@ from homeassistant.core import Config, HomeAssistant
 from homeassistant.loader import async_get_integration
 
 from .base import MuiBase
-from .const import DOMAIN, NAME
+from .const import (
+    CONF_INCLUDE_OTHER_CARDS,
+    CONF_LANGUAGE,
+    CONF_SIDEPANEL_ENABLED,
+    CONF_SIDEPANEL_ICON,
+    CONF_SIDEPANEL_TITLE,
+    CONF_THEME,
+    CONF_THEME_PATH,
+    DOMAIN,
+    NAME,
+)
 from .enums import ConfigurationType, muiDisabledReason
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Reloads re-enter async_setup_entry, only add one update listener per entry
+_UPDATE_LISTENERS: dict[str, Callable[[], None]] = {}
+
 
 async def async_initialize_integration(
     hass: HomeAssistant,
@@ -23,13 +37,17 @@ async def async_initialize_integration(
     config: dict[str, Any] | None = None,
 ) -> bool:
     """Initialize the integration."""
+    previous: MuiBase | None = hass.data.get(DOMAIN)
     hass.data[DOMAIN] = mui = MuiBase()
     mui.enable_mui()
 
     if config is not None:
         if DOMAIN not in config:
             return True
-        if mui.configuration.config_type == ConfigurationType.CONFIG_ENTRY:
+        if (
+            previous is not None
+            and previous.configuration.config_type == ConfigurationType.CONFIG_ENTRY
+        ):
             return True
         mui.configuration.update_from_dict(
             {
@@ -56,7 +74,13 @@ async def async_initialize_integration(
             }
         )
 
-    integration = await async_get_integration(hass, DOMAIN)
+    # Reloads re-enter here, reuse the already loaded integration
+    if previous is not None and previous.integration is not None:
+        integration = previous.integration
+        # Don't start copying while the previous copy is still running
+        mui.copy_task = previous.copy_task
+    else:
+        integration = await async_get_integration(hass, DOMAIN)
 
     mui.integration = integration
     mui.version = integration.version
@@ -65,11 +89,16 @@ async def async_initialize_integration(
 
     async def async_startup():
         """MUI Startup tasks."""
-        if (
-            not await mui.configure_mui()
-            or not await mui.configure_plugins()
-            or not await mui.configure_dashboard()
-        ):
+        results = await asyncio.gather(
+            mui.configure_mui(),
+            mui.configure_plugins(),
+            mui.configure_dashboard(),
+            return_exceptions=True,
+        )
+        if not all(result is True for result in results):
+            for result in results:
+                if isinstance(result, BaseException):
+                    _LOGGER.error("MUI startup failed", exc_info=result)
             return False
 
         mui.enable_mui()
@@ -83,6 +112,9 @@ async def async_initialize_integration(
     if not startup_result:
         return False
 
+    # Copying the dashboard assets is not needed to finish setup
+    await mui.async_start_copy_assets()
+
     mui.enable_mui()
 
     return True
@@ -96,7 +128,10 @@ async def async_setup(hass: HomeAssistant, config: Config):
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
 
-    config_entry.add_update_listener(async_reload_entry)
+    if config_entry.entry_id not in _UPDATE_LISTENERS:
+        _UPDATE_LISTENERS[config_entry.entry_id] = config_entry.add_update_listener(
+            async_reload_entry
+        )
     return await async_initialize_integration(hass=hass, config_entry=config_entry)
 
 
@@ -108,10 +143,38 @@ async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     #  - themes
     #  - blueprints
     frontend.async_remove_panel(hass, "minimalist-ui")
+    hass.services.async_remove(DOMAIN, "reload")
+
+    if (unlisten := _UPDATE_LISTENERS.pop(config_entry.entry_id, None)) is not None:
+        unlisten()
 
 
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Reload Integration."""
     _LOGGER.debug("Reload the config entry")
 
-    await async_setup_entry(hass, config_entry)
+    mui: MuiBase | None = hass.data.get(DOMAIN)
+    if mui is None or mui.integration is None:
+        await async_setup_entry(hass, config_entry)
+        return
+
+    # Only re-run the setup steps depending on the changed options
+    previous = mui.configuration.to_dict()
+    mui.configuration.update_from_dict({**config_entry.data, **config_entry.options})
+    current = mui.configuration.to_dict()
+    changed = {key for key in current if current[key] != previous[key]}
+
+    reloaded = True
+    if changed & {CONF_SIDEPANEL_ENABLED, CONF_SIDEPANEL_ICON, CONF_SIDEPANEL_TITLE}:
+        if not await mui.configure_dashboard():
+            _LOGGER.error("Could not reload the MUI dashboard")
+            reloaded = False
+    if CONF_INCLUDE_OTHER_CARDS in changed:
+        if not await mui.configure_plugins():
+            _LOGGER.error("Could not reload the MUI plugins")
+            reloaded = False
+    if changed & {CONF_LANGUAGE, CONF_SIDEPANEL_ENABLED, CONF_THEME, CONF_THEME_PATH}:
+        await mui.async_start_copy_assets()
+
+    if reloaded:
+        mui.enable_mui()
@@ -1,11 +1,14 @@
 """Base Minimalist UI class."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import pathlib
 import shutil
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any, Awaitable, Callable
 
 from homeassistant.components.frontend import add_extra_js_url, async_remove_panel
@@ -16,6 +19,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.loader import Integration
 
 from .const import (
+    DEFAULT_COMMUNITY_CARDS_ENABLED,
     DEFAULT_INCLUDE_OTHER_CARDS,
     DEFAULT_LANGUAGE,
     DEFAULT_SIDEPANEL_ENABLED,
@@ -23,6 +27,7 @@ from .const import (
     DEFAULT_SIDEPANEL_TITLE,
     DEFAULT_THEME,
     DEFAULT_THEME_PATH,
+    DEPENDENCY_RESOURCES,
     DOMAIN,
     GITHUB_REPO,
     LANGUAGES,
@@ -34,7 +39,7 @@ from .utils.decode import decode_content
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MuiSystem:
     """MUI System info."""
 
@@ -47,11 +52,11 @@ class MuiSystem:
         return self.disabled_reason is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class MuiConfiguration:
     """MuiConfiguration class."""
 
-    config: dict[str, Any] = field(default_factory=dict)
+    _config: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
     config_entry: ConfigEntry | None = None
     config_type: ConfigurationType | None = None
     sidepanel_enabled: bool = DEFAULT_SIDEPANEL_ENABLED
@@ -66,44 +71,99 @@ class MuiConfiguration:
     include_other_cards: bool = DEFAULT_INCLUDE_OTHER_CARDS
     language: str = DEFAULT_LANGUAGE
     token: str = None
+    community_cards_enabled: bool = DEFAULT_COMMUNITY_CARDS_ENABLED
+    community_cards: list[str] = field(default_factory=list)
+    _cached_json: dict | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def config(self) -> MappingProxyType[str, Any]:
+        """Return the raw configuration, update it with update_from_dict."""
+        return MappingProxyType(self._config)
 
     def to_dict(self) -> dict:
         """Return Dict."""
-        return self.__dict__
+        return {
+            "config": self.config,
+            **{f.name: getattr(self, f.name) for f in fields(self) if f.init},
+        }
 
-    def to_json(self) -> str:
-        """Return a json string."""
-        return asdict(self)
+    def as_json_dict(self) -> MappingProxyType[str, Any]:
+        """Return a read-only view of the JSON serializable options.
+
+        The values are cached until the next update_from_dict call, setting
+        attributes directly does not invalidate the cache.
+        """
+        if self._cached_json is None:
+            self._cached_json = self._build_json_dict()
+
+        return MappingProxyType(self._cached_json)
+
+    def _build_json_dict(self) -> dict:
+        """Build the JSON serializable dict."""
+        return {
+            "config_type": self.config_type,
+            "sidepanel_enabled": self.sidepanel_enabled,
+            "sidepanel_icon": self.sidepanel_icon,
+            "sidepanel_title": self.sidepanel_title,
+            "adaptive_ui_enabled": self.adaptive_ui_enabled,
+            "adaptive_ui_icon": self.adaptive_ui_icon,
+            "adaptive_ui_title": self.adaptive_ui_title,
+            "theme_path": self.theme_path,
+            "theme": self.theme,
+            "plugin_path": self.plugin_path,
+            "include_other_cards": self.include_other_cards,
+            "language": self.language,
+            "community_cards_enabled": self.community_cards_enabled,
+            "community_cards": tuple(self.community_cards),
+        }
 
     def update_from_dict(self, data: dict) -> None:
         """Set attributes from dicts."""
         if not isinstance(data, dict):
-            raise Exception("Configuration is not valid.")
+            raise TypeError("Configuration is not valid.")
+
+        if "config" in data:
+            self._config = dict(data["config"])
+
+        # Slotted (no __dict__), keys which are not fields are ignored
+        for key in data.keys() & _CONFIGURATION_FIELDS:
+            setattr(self, key, data[key])
+
+        self._cached_json = None
 
-        for key in data:
-            self.__setattr__(key, data[key])
+
+# Settable MuiConfiguration fields, private fields are excluded
+_CONFIGURATION_FIELDS = frozenset(f.name for f in fields(MuiConfiguration) if f.init)
 
 
 class MuiBase:
     """Base Minimalist UI"""
 
-    integration: Integration | None = None
-    configuration = MuiConfiguration()
-    hass: HomeAssistant | None = None
     log: logging.Logger = _LOGGER
-    githubapi: GitHubAPI | None = None
-    system = MuiSystem()
-    version: str | None = None
 
-    @property
+    def __init__(self) -> None:
+        """Initialize."""
+        self.integration: Integration | None = None
+        self.configuration = MuiConfiguration()
+        self.hass: HomeAssistant | None = None
+        self.githubapi: GitHubAPI | None = None
+        self.system = MuiSystem()
+        self.version: str | None = None
+        self.copy_task: asyncio.Task | None = None
+
+    @cached_property
     def integration_dir(self) -> pathlib.Path:
         """Return the MUI integration dir."""
         return self.integration.file_path
 
-    @property
+    @cached_property
     def templates_dir(self) -> pathlib.Path:
         """Return the Button Cards Template dir."""
-        return pathlib.Path(f"{self.integration_dir}/__ui_minimalist__/mui_templates")
+        return (
+            pathlib.Path(self.integration_dir) / "__ui_minimalist__" / "mui_templates"
+        )
 
     def disable_mui(self, reason: muiDisabledReason) -> None:
         """Disable Mui."""
@@ -130,63 +190,61 @@ class MuiBase:
 
         self.log.debug("Saving file: %s" % file_path)
 
-        def _write_file():
+        def _write_file() -> bool:
+            is_text = isinstance(content, str)
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             with open(
                 file_path,
-                mode="w" if isinstance(content, str) else "wb",
-                encoding="utf-8" if isinstance(content, str) else None,
-                errors="ignore" if isinstance(content, str) else None,
+                mode="w" if is_text else "wb",
+                encoding="utf-8" if is_text else None,
+                errors="ignore" if is_text else None,
             ) as file_handler:
                 file_handler.write(content)
+            return os.path.exists(file_path)
 
         try:
-            await self.hass.async_add_executor_job(_write_file)
+            return await self.hass.async_add_executor_job(_write_file)
         except (
             BaseException
         ) as error:  # lgtm [py/catch-base-exception] pylint: disable=broad-except
             self.log.error(f"Could not write data to {file_path} - {error}")
             return False
 
-        return os.path.exists(file_path)
-
     async def configure_plugins(self) -> bool:
         """Configure the Plugins MUI depends on."""
         self.log.debug("Checking Dependencies.")
 
-        try:
-            if not os.path.exists(
+        def _installed_plugins() -> tuple[bool, set[str]]:
+            browser_mod = os.path.exists(
                 self.hass.config.path("custom_components/browser_mod")
-            ):
+            )
+            try:
+                with os.scandir(self.hass.config.path("www/community")) as entries:
+                    return browser_mod, {entry.name for entry in entries}
+            except OSError:
+                return browser_mod, set()
+
+        try:
+            browser_mod, installed = await self.hass.async_add_executor_job(
+                _installed_plugins
+            )
+            if not browser_mod:
                 self.log.error('HACS Integration repo "browser mod" is not installed!')
 
-            dependency_resource_paths = [
-                "button-card",
-                "light-entity-card",
-                "lovelace-card-mod",
-                "lovelace-auto-entities",
-                "mini-graph-card",
-                "mini-media-player",
-                "my-cards",
-                "simple-weather-card",
-                "lovelace-layout-card",
-                "lovelace-state-switch",
-                "weather-radar-card",
-            ]
-            for p in dependency_resource_paths:
+            for p in DEPENDENCY_RESOURCES:
                 if not self.configuration.include_other_cards:
-                    if not os.path.exists(self.hass.config.path(f"www/community/{p}")):
+                    if p not in installed:
                         self.log.error(
                             f'HACS Frontend repo "{p}" is not installed, See Integration Configuration.'
                         )
                 else:
-                    if os.path.exists(self.hass.config.path(f"www/community/{p}")):
+                    if p in installed:
                         _LOGGER.error(
                             f'HACS Frontend repo "{p}" is already installed, Remove it or disable include custom cards'
                         )
 
             if self.configuration.include_other_cards:
-                for c in dependency_resource_paths:
+                for c in DEPENDENCY_RESOURCES:
                     add_extra_js_url(
                         self.hass, f"/minimalist_ui/ext_dependencies/{c}/{c}.js"
                     )
@@ -263,110 +321,134 @@ class MuiBase:
         return True
 
     async def configure_mui(self) -> bool:
-        """Configure initial dashboard & cards directory."""
+        """Configure the MUI services."""
         self.log.info("Setup MUI Configuration")
 
         try:
+            if not self.hass.services.has_service(DOMAIN, "reload"):
+                # Registered once, don't capture self (reload the current MuiBase)
+                hass = self.hass
+
+                async def handle_reload(call):
+                    _LOGGER.debug("Reload Minimalist UI Configuration")
+
+                    mui: MuiBase = hass.data[DOMAIN]
+                    await mui.reload_configuration()
+
+                # Register servcie minimalist_ui.reload
+                hass.services.async_register(DOMAIN, "reload", handle_reload)
+
+        except Exception as exception:
+            self.log.error(exception)
+            self.disable_mui(muiDisabledReason.LOAD_MUI)
+            return False
+
+        return True
+
+    async def async_copy_assets(self) -> None:
+        """Copy the dashboard, cards & themes into the config dir."""
+        await self.hass.async_add_executor_job(self._sync_copy_assets)
+
+    async def async_start_copy_assets(self) -> None:
+        """Copy the assets in a background task, once any running copy is done."""
+        # Loop, another caller may have started a copy while waiting
+        while self.copy_task is not None and not self.copy_task.done():
+            await self.copy_task
+
+        self.copy_task = self.hass.async_create_background_task(
+            self.async_copy_assets(), name="mui_asset_copy"
+        )
+
+    def _sync_copy_assets(self) -> None:
+        """Copy the dashboard, cards & themes into the config dir (runs in executor)."""
+        try:
+            integration_dir = self.integration_dir
+            templates_dir = self.templates_dir
+            # Translations
+            language = LANGUAGES[self.configuration.language]
+
+            base = self.hass.config.path(DOMAIN)
+            dashboard_dir = f"{base}/dashboard"
+            actions_dir = f"{base}/custom_actions"
+            ui_yaml = f"{dashboard_dir}/ui.yaml"
+            actions_yaml = f"{actions_dir}/custom_actions.yaml"
+            theme_target = self.hass.config.path(f"{self.configuration.theme_path}/")
+
             # Cleanup
-            shutil.rmtree(
-                self.hass.config.path(f"{DOMAIN}/configs"), ignore_errors=True
-            )
-            shutil.rmtree(self.hass.config.path(f"{DOMAIN}/addons"), ignore_errors=True)
+            shutil.rmtree(f"{base}/configs", ignore_errors=True)
+            shutil.rmtree(f"{base}/addons", ignore_errors=True)
             # Create config dir
-            os.makedirs(self.hass.config.path(f"{DOMAIN}/dashboard"), exist_ok=True)
-            os.makedirs(
-                self.hass.config.path(f"{DOMAIN}/custom_actions"), exist_ok=True
-            )
-
-            if os.path.exists(self.hass.config.path(f"{DOMAIN}/dashboard")):
-                os.makedirs(self.templates_dir, exist_ok=True)
+            os.makedirs(dashboard_dir, exist_ok=True)
+            os.makedirs(actions_dir, exist_ok=True)
 
-                # Translations
-                language = LANGUAGES[self.configuration.language]
+            if os.path.exists(dashboard_dir):
+                os.makedirs(templates_dir, exist_ok=True)
 
                 # Copy default language file over to config dir
                 shutil.copy2(
-                    f"{self.integration_dir}/dashboard/translations/default.yaml",
-                    f"{self.templates_dir}/default.yaml",
+                    f"{integration_dir}/dashboard/translations/default.yaml",
+                    f"{templates_dir}/default.yaml",
                 )
                 # Copy example dashboard file over to user config dir if not exists
                 if self.configuration.sidepanel_enabled:
-                    if not os.path.exists(
-                        self.hass.config.path(f"{DOMAIN}/dashboard/ui.yaml")
-                    ):
-                        shutil.copy2(
-                            f"{self.integration_dir}/dashboard/ui.yaml",
-                            self.hass.config.path(f"{DOMAIN}/dashboard/ui.yaml"),
-                        )
+                    if not os.path.exists(ui_yaml):
+                        shutil.copy2(f"{integration_dir}/dashboard/ui.yaml", ui_yaml)
                 # Copy adaptive dashboard if not exists and is selected as option
                 # if self.configuration.adaptive_ui_enabled:
-                #    if not os.path.exists(
-                #        self.hass.config.path(f"{DOMAIN}/dashboard/adaptive-dash")
-                #    ):
+                #    if not os.path.exists(f"{dashboard_dir}/adaptive-dash"):
                 #        shutil.copytree(
-                #            f"{self.integration_dir}/dashboard/adaptive-dash",
-                #            self.hass.config.path(f"{DOMAIN}/dashboard/adaptive-dash"),
+                #            f"{integration_dir}/dashboard/adaptive-dash",
+                #            f"{dashboard_dir}/adaptive-dash",
                 #        )
                 # Copy example custom actions file over to user config dir if not exists
-                if not os.path.exists(
-                    self.hass.config.path(
-                        f"{DOMAIN}/custom_actions/custom_actions.yaml"
-                    )
-                ):
+                if not os.path.exists(actions_yaml):
                     shutil.copy2(
-                        f"{self.integration_dir}/dashboard/custom_actions.yaml",
-                        self.hass.config.path(
-                            f"{DOMAIN}/custom_actions/custom_actions.yaml"
-                        ),
+                        f"{integration_dir}/dashboard/custom_actions.yaml",
+                        actions_yaml,
                     )
                 # Copy chosen language file over to config dir
                 shutil.copy2(
-                    f"{self.integration_dir}/dashboard/translations/{language}.yaml",
-                    f"{self.templates_dir}/language.yaml",
+                    f"{integration_dir}/dashboard/translations/{language}.yaml",
+                    f"{templates_dir}/language.yaml",
                 )
                 # Copy over cards from integration
                 shutil.copytree(
-                    f"{self.integration_dir}/dashboard/mui_templates",
-                    f"{self.templates_dir}",
+                    f"{integration_dir}/dashboard/mui_templates",
+                    f"{templates_dir}",
                     dirs_exist_ok=True,
                 )
                 # Copy over manually installed custom_actions from user
                 shutil.copytree(
-                    self.hass.config.path(f"{DOMAIN}/custom_actions"),
-                    f"{self.templates_dir}/custom_actions",
+                    actions_dir,
+                    f"{templates_dir}/custom_actions",
                     dirs_exist_ok=True,
                 )
                 # Copy over themes to defined themes folder
                 shutil.copytree(
-                    f"{self.integration_dir}/dashboard/themefiles",
-                    self.hass.config.path(f"{self.configuration.theme_path}/"),
+                    f"{integration_dir}/dashboard/themefiles",
+                    theme_target,
                     dirs_exist_ok=True,
                 )
 
-            self.hass.bus.async_fire("minimalist_ui_reload")
-
-            async def handle_reload(call):
-                _LOGGER.debug("Reload Minimalist UI Configuration")
-
-                self.reload_configuration()
-
-            # Register servcie minimalist_ui.reload
-            self.hass.services.async_register(DOMAIN, "reload", handle_reload)
-
         except Exception as exception:
             self.log.error(exception)
             self.disable_mui(muiDisabledReason.LOAD_MUI)
-            return False
+            return
 
-        return True
+        # Thread-safe fire, this runs outside the event loop
+        self.hass.bus.fire("minimalist_ui_reload")
 
-    def reload_configuration(self):
+    async def reload_configuration(self):
         """Reload Configuration."""
-        if os.path.exists(self.hass.config.path(f"{DOMAIN}/custom_actions")):
-            # Copy over manually installed custom_actions from user
-            shutil.copytree(
-                self.hass.config.path(f"{DOMAIN}/custom_actions"),
-                f"{self.templates_dir}/custom_actions",
-                dirs_exist_ok=True,
-            )
+
+        def _copy_custom_actions():
+            if os.path.exists(self.hass.config.path(f"{DOMAIN}/custom_actions")):
+                # Copy over manually installed custom_actions from user
+                shutil.copytree(
+                    self.hass.config.path(f"{DOMAIN}/custom_actions"),
+                    f"{self.templates_dir}/custom_actions",
+                    dirs_exist_ok=True,
+                )
+
+        await self.hass.async_add_executor_job(_copy_custom_actions)
         self.hass.bus.async_fire("minimalist_ui_reload")
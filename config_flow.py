@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
@@ -52,8 +53,25 @@ from .enums import ConfigurationType
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 
-async def mui_config_option_schema(options: dict = {}) -> dict:
-    """Return a schema for MUI configuration options."""
+# Options read by the schema (including the disabled ones), used as cache key
+_OPTION_SCHEMA_KEYS = (
+    CONF_LANGUAGE,
+    CONF_SIDEPANEL_ENABLED,
+    CONF_SIDEPANEL_TITLE,
+    CONF_SIDEPANEL_ICON,
+    CONF_SIDEPANEL_ADV_ENABLED,
+    CONF_SIDEPANEL_ADV_TITLE,
+    CONF_SIDEPANEL_ADV_ICON,
+    CONF_THEME,
+    CONF_THEME_PATH,
+    CONF_INCLUDE_OTHER_CARDS,
+)
+
+
+@lru_cache(maxsize=32)
+def _build_option_schema(key: tuple) -> dict:
+    """Build the options schema for a snapshot of the current option values."""
+    options = dict(key)
 
     # Also update base.py MuiConfiguration
     return {
@@ -100,6 +118,15 @@ async def mui_config_option_schema(options: dict = {}) -> dict:
     }
 
 
+async def mui_config_option_schema(options: dict = {}) -> dict:
+    """Return a schema for MUI configuration options."""
+    key = tuple(
+        (option, options[option]) for option in _OPTION_SCHEMA_KEYS if option in options
+    )
+    # Copy, callers extend the schema
+    return dict(_build_option_schema(key))
+
+
 class MuiFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Minimalist UI"""
 
@@ -1,4 +1,5 @@
 """Constants for Minimalist UI"""
+from types import MappingProxyType
 from typing import TypeVar
 
 TV = TypeVar("TV")
@@ -17,7 +18,22 @@ ISSUE_URL = "https://github.com/stokkie90/ui-lovelace-minimalist/issues"
 
 GITHUB_REPO = "benbur98/Minimalist_HomeAssistant"
 
-LANGUAGES = {"English (GB)": "en"}
+# HACS Frontend repos MUI depends on
+DEPENDENCY_RESOURCES = (
+    "button-card",
+    "light-entity-card",
+    "lovelace-card-mod",
+    "lovelace-auto-entities",
+    "mini-graph-card",
+    "mini-media-player",
+    "my-cards",
+    "simple-weather-card",
+    "lovelace-layout-card",
+    "lovelace-state-switch",
+    "weather-radar-card",
+)
+
+LANGUAGES = MappingProxyType({"English (GB)": "en"})
 CONF_LANGUAGE = "language"
 CONF_LANGUAGES = ["English (GB)"]
 
@@ -1,16 +1,16 @@
 """Helper constants."""
 # pylint: disable=missing-class-docstring
-from enum import Enum
+from homeassistant.backports.enum import StrEnum
 
 
-class ConfigurationType(str, Enum):
+class ConfigurationType(StrEnum):
     """What typ of config is used."""
 
     YAML = "yaml"
     CONFIG_ENTRY = "config_entry"
 
 
-class muiDisabledReason(str, Enum):
+class muiDisabledReason(StrEnum):
     """Reasons to disable MUI."""
 
     RATE_LIMIT = "rate_limit"